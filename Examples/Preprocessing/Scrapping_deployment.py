@@ -1,6 +1,11 @@
 # main.py
+import asyncio
 import logging
-from URL_scrapper import scrape_url
+from concurrent.futures import ProcessPoolExecutor
+from URL_scrapper import scrape_url, scrape_url_async, create_async_client
+from PDF_scrapper import scrape_pdf
+from JSON_scrapper import scrape_json
+from TXT_scrapper import scrape_txt
 logging.basicConfig(level=logging.INFO)
 
 class TextScraper:
@@ -32,4 +37,65 @@ class TextScraper:
             text_fields = kwargs.get('text_fields')
             return scrape_json(source, text_fields)
         elif source_type == 'txt':
-            return scrape_txt(source)
\ No newline at end of file
+            return scrape_txt(source)
+    
+    def scrape_many(self, sources, max_concurrency=32, **kwargs):
+        """
+        Scrapes several sources concurrently from synchronous code. Inside a running
+        event loop (e.g. a FastAPI handler) await scrape_many_async instead.
+        
+        Args:
+            sources (list): (source, source_type) pairs
+            max_concurrency (int): Maximum number of sources in flight at once
+            **kwargs: Additional arguments for specific scrapers
+            
+        Returns:
+            list: Scraped text and metadata for each source, in input order (None on failure)
+        """
+        return asyncio.run(self.scrape_many_async(sources, max_concurrency, **kwargs))
+    
+    async def scrape_many_async(self, sources, max_concurrency=32, **kwargs):
+        """
+        Scrapes several sources concurrently. URL fetches overlap on one HTTP/2
+        client while parsing runs in a process pool.
+        
+        Args:
+            sources (list): (source, source_type) pairs
+            max_concurrency (int): Maximum number of sources in flight at once
+            **kwargs: Additional arguments for specific scrapers
+            
+        Returns:
+            list: Scraped text and metadata for each source, in input order (None on failure)
+        """
+        for _, source_type in sources:
+            if source_type not in self.supported_types:
+                raise ValueError(f"Unsupported source type. Must be one of {self.supported_types}")
+        
+        text_fields = kwargs.get('text_fields')
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async with create_async_client(max_concurrency) as client:
+            with ProcessPoolExecutor() as executor:
+                async def scrape_file(scraper, *args):
+                    async with semaphore:
+                        try:
+                            return await loop.run_in_executor(executor, scraper, *args)
+                        except Exception as e:
+                            # Pool-level failures (e.g. BrokenProcessPool) for this source only
+                            logging.error(f"Error processing {args[0]}: {str(e)}")
+                            return None
+                
+                def scrape_one(source, source_type):
+                    if source_type == 'url':
+                        return scrape_url_async(client, semaphore, source, executor)
+                    elif source_type == 'pdf':
+                        return scrape_file(scrape_pdf, source)
+                    elif source_type == 'json':
+                        return scrape_file(scrape_json, source, text_fields)
+                    elif source_type == 'txt':
+                        return scrape_file(scrape_txt, source)
+                
+                return await asyncio.gather(
+                    *[scrape_one(source, source_type) for source, source_type in sources]
+                )
\ No newline at end of file
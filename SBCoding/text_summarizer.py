@@ -1,16 +1,34 @@
+import os
+import re
+from collections import OrderedDict
 import torch
-from transformers import AutoTokenizer, AutoModel, pipeline
-from sklearn.cluster import KMeans
+from transformers import AutoTokenizer, AutoModel, AutoModelForSeq2SeqLM
 import numpy as np
 from typing import List, Dict, Tuple
 import logging
-from torch.nn.functional import cosine_similarity
+from torch.nn.functional import normalize
+
+# A sentence runs up to terminal punctuation followed by whitespace (or the end
+# of the text), plus trailing whitespace; '3.14', '2.0.1' and 'www.example.com'
+# stay intact
+_SENTENCE_PATTERN = re.compile(r'(?:[^.!?]|[.!?](?=\S))+(?:[.!?]+|$)\s*')
+
+# Tokenization cache for repeated sentences (headers, boilerplate); short
+# sentences are cheaper to re-tokenize than to cache
+_TOKEN_CACHE_SIZE = 4096
+_MIN_CACHED_SENTENCE_LENGTH = 20
 
 class BertSummarizer:
     def __init__(self, model_name: str = 'bert-base-uncased', 
                  max_length: int = 130, 
                  min_length: int = 30,
-                 device: str = None):
+                 device: str = None,
+                 batch_size: int = 32,
+                 abstractive_model_name: str = 'sshleifer/distilbart-cnn-12-6',
+                 quantized: bool = False,
+                 quantized_model_dir: str = None,
+                 compile_tensorrt: bool = False,
+                 tensorrt_cache_path: str = None):
         """
         Initialize the BERT-based summarizer.
         
@@ -19,21 +37,164 @@ class BertSummarizer:
             max_length (int): Maximum length of the summary
             min_length (int): Minimum length of the summary
             device (str): Device to use for computation ('cuda' or 'cpu')
+            batch_size (int): Number of sentences per BERT forward pass
+            abstractive_model_name (str): Name of the seq2seq model used for abstractive summarization
+            quantized (bool): Run the BERT encoder as an INT8-quantized ONNX Runtime model on CPU
+            quantized_model_dir (str): Directory to cache the quantized ONNX model in
+            compile_tensorrt (bool): Compile the BERT encoder with Torch-TensorRT (CUDA only,
+                ignored with quantized=True; requires torch-tensorrt>=2.3 and its matching torch>=2.3)
+            tensorrt_cache_path (str): File to cache the compiled TensorRT program in
         """
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
         self.max_length = max_length
         self.min_length = min_length
+        self.batch_size = batch_size
+        self.quantized = quantized
+        
+        # Run the encoder in half precision: FP16 on CUDA, BF16 autocast on CPU
+        self.device_type = torch.device(self.device).type
+        self.autocast_dtype = torch.float16 if self.device_type == 'cuda' else torch.bfloat16
         
         # Initialize BERT model and tokenizer
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.bert_model = AutoModel.from_pretrained(model_name).to(self.device)
+        if quantized:
+            # ONNX Runtime INT8 kernels run on CPU (VNNI)
+            self.encoder_device = 'cpu'
+            self.bert_model = self._load_quantized_encoder(
+                model_name,
+                quantized_model_dir or f"{model_name.replace('/', '_')}-onnx-int8"
+            )
+        else:
+            self.encoder_device = self.device
+            self.bert_model = AutoModel.from_pretrained(
+                model_name,
+                torch_dtype=torch.float16 if self.device_type == 'cuda' else torch.float32
+            ).to(self.device)
+            self.bert_model.eval()
+        
+        # Optionally replace the encoder forward with a fused FP16 TensorRT engine
+        self.compiled_encoder = None
+        if compile_tensorrt and (quantized or self.device_type != 'cuda'):
+            logging.warning("compile_tensorrt=True ignored: TensorRT needs a CUDA device "
+                            "and cannot be combined with quantized=True")
+        elif compile_tensorrt:
+            self.compiled_encoder = self._compile_tensorrt_encoder(
+                tensorrt_cache_path or f"{model_name.replace('/', '_')}-trt-b{batch_size}.ep"
+            )
         
-        # Initialize summarization pipeline
-        self.summarizer = pipeline("summarization", device=self.device)
+        # Initialize abstractive summarization model
+        self.abs_tokenizer = AutoTokenizer.from_pretrained(abstractive_model_name)
+        self.abs_model = AutoModelForSeq2SeqLM.from_pretrained(
+            abstractive_model_name,
+            torch_dtype=torch.float16 if self.device_type == 'cuda' else torch.float32
+        ).to(self.device)
+        self.abs_model.eval()
         
         # Initialize logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+        
+        # LRU cache of sentence -> encoding, bounded at _TOKEN_CACHE_SIZE entries
+        self._token_cache = OrderedDict()
+
+    def _load_quantized_encoder(self, model_name: str, save_dir: str):
+        """
+        Export the BERT encoder to ONNX and INT8-quantize it, reusing a cached export if present.
+        
+        Args:
+            model_name (str): Name of the BERT model to export
+            save_dir (str): Directory holding the quantized ONNX model
+            
+        Returns:
+            ORTModelForFeatureExtraction: Quantized encoder running on ONNX Runtime
+        """
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        
+        if not os.path.exists(os.path.join(save_dir, 'model_quantized.onnx')):
+            # Dynamic quantization: activations are scaled at runtime, so no calibration set is needed
+            onnx_model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+            quantizer = ORTQuantizer.from_pretrained(onnx_model)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+        
+        return ORTModelForFeatureExtraction.from_pretrained(
+            save_dir,
+            file_name='model_quantized.onnx',
+            provider='CPUExecutionProvider'
+        )
+
+    def _compile_tensorrt_encoder(self, cache_path: str):
+        """
+        Compile the BERT encoder with Torch-TensorRT, reusing a cached program if present.
+        
+        Args:
+            cache_path (str): File holding the compiled TensorRT program
+            
+        Returns:
+            torch.nn.Module: Module mapping (input_ids, attention_mask) to the last hidden state
+        """
+        # torch_tensorrt.save (and loading via torch.export) needs torch-tensorrt>=2.3
+        import torch_tensorrt
+        
+        if os.path.exists(cache_path):
+            return torch.export.load(cache_path).module()
+        
+        class _Encoder(torch.nn.Module):
+            def __init__(self, model):
+                super().__init__()
+                self.model = model
+                
+            def forward(self, input_ids, attention_mask):
+                return self.model(input_ids=input_ids,
+                                  attention_mask=attention_mask).last_hidden_state
+        
+        # Dynamic over batch 1..batch_size and sequence length 8..512
+        max_batch = max(1, self.batch_size)
+        opt_batch = min(8, max_batch)
+        inputs = [
+            torch_tensorrt.Input(min_shape=(1, 8), opt_shape=(opt_batch, 128),
+                                 max_shape=(max_batch, 512), dtype=torch.int64)
+            for _ in range(2)
+        ]
+        compiled = torch_tensorrt.compile(
+            _Encoder(self.bert_model).eval(),
+            ir='dynamo',
+            inputs=inputs,
+            enabled_precisions={torch.float16},
+            min_block_size=1
+        )
+        example_inputs = [
+            torch.randint(0, self.tokenizer.vocab_size, (opt_batch, 128), device=self.device),
+            torch.ones(opt_batch, 128, dtype=torch.long, device=self.device)
+        ]
+        torch_tensorrt.save(compiled, cache_path, inputs=example_inputs)
+        return compiled
+
+    def _tokenize_one(self, sentence: str) -> Dict[str, Tuple[int, ...]]:
+        """
+        Tokenize a single sentence, reusing the cached encoding for repeated sentences.
+        
+        Args:
+            sentence (str): Sentence to tokenize
+            
+        Returns:
+            Dict[str, Tuple[int, ...]]: Unpadded encoding (input_ids, attention_mask, ...)
+        """
+        encoding = self._token_cache.get(sentence)
+        if encoding is not None:
+            self._token_cache.move_to_end(sentence)
+            return encoding
+        
+        encoding = {
+            key: tuple(value)
+            for key, value in self.tokenizer(sentence, truncation=True, max_length=512).items()
+        }
+        if len(sentence) >= _MIN_CACHED_SENTENCE_LENGTH:
+            self._token_cache[sentence] = encoding
+            if len(self._token_cache) > _TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+        return encoding
 
     def _get_sentence_embeddings(self, sentences: List[str]) -> torch.Tensor:
         """
@@ -45,24 +206,98 @@ class BertSummarizer:
         Returns:
             torch.Tensor: Tensor of sentence embeddings
         """
-        embeddings = []
+        # Tokenize each sentence once, then sort by token length so each
+        # mini-batch is padded only to the length of its own longest member
+        encodings = [self._tokenize_one(s) for s in sentences]
+        lengths = torch.tensor([len(e['input_ids']) for e in encodings])
+        order = torch.argsort(lengths)
         
-        for sentence in sentences:
-            # Tokenize and encode sentence
-            inputs = self.tokenizer(sentence, 
-                                  return_tensors='pt',
-                                  padding=True, 
-                                  truncation=True, 
-                                  max_length=512).to(self.device)
-            
-            # Generate BERT embeddings
-            with torch.no_grad():
-                outputs = self.bert_model(**inputs)
+        batch_embeddings = []
+        with torch.inference_mode(), torch.autocast(device_type=self.device_type,
+                                                    dtype=self.autocast_dtype,
+                                                    enabled=not self.quantized):
+            for start in range(0, len(sentences), self.batch_size):
+                batch_idx = order[start:start + self.batch_size]
+                
+                # Pad the bucket of similar-length encodings into a batch
+                inputs = self.tokenizer.pad(
+                    [{key: list(value) for key, value in encodings[i].items()}
+                     for i in batch_idx.tolist()],
+                    return_tensors='pt',
+                    padding=True,
+                    pad_to_multiple_of=8
+                ).to(self.encoder_device)
+                
+                if self.compiled_encoder is not None:
+                    hidden_states = self.compiled_encoder(inputs['input_ids'],
+                                                          inputs['attention_mask'])
+                else:
+                    hidden_states = self.bert_model(**inputs).last_hidden_state
+                
                 # Use [CLS] token embedding as sentence representation
-                sentence_embedding = outputs.last_hidden_state[:, 0, :]
-                embeddings.append(sentence_embedding)
+                batch_embeddings.append(hidden_states[:, 0, :])
+            
+            # Scatter embeddings back to the original sentence order
+            sorted_embeddings = torch.cat(batch_embeddings, dim=0)
+            embeddings = torch.empty_like(sorted_embeddings)
+            embeddings.index_copy_(0, order.to(embeddings.device), sorted_embeddings)
         
-        return torch.cat(embeddings, dim=0)
+        # Clustering and similarity ranking expect FP32
+        return embeddings.float().to(self.device)
+
+    def _kmeans_torch(self, 
+                      X: torch.Tensor, 
+                      k: int, 
+                      n_iter: int = 20, 
+                      seed: int = 42) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Cluster embeddings with K-means (K-means++ init, Lloyd iterations) on X's device.
+        
+        Args:
+            X (torch.Tensor): Tensor of shape (N, D) to cluster
+            k (int): Number of clusters
+            n_iter (int): Maximum number of Lloyd iterations
+            seed (int): Seed for centroid initialization
+            
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Cluster labels (N,) and centroids (k, D)
+        """
+        generator = torch.Generator(device=X.device).manual_seed(seed)
+        x_sq = (X * X).sum(dim=1)
+        
+        def sq_distances(C: torch.Tensor) -> torch.Tensor:
+            # ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2, computed as a single GEMM
+            dists = x_sq[:, None] - 2 * (X @ C.T) + (C * C).sum(dim=1)[None, :]
+            return dists.clamp_min_(0)
+        
+        # K-means++ initialization
+        first = torch.randint(X.shape[0], (1,), device=X.device, generator=generator)
+        centroids = X[first]
+        min_dists = sq_distances(centroids).squeeze(1)
+        for _ in range(1, k):
+            if min_dists.sum() > 0:
+                weights = min_dists
+            else:
+                weights = torch.ones_like(min_dists)
+            idx = torch.multinomial(weights, 1, generator=generator)
+            centroids = torch.cat([centroids, X[idx]], dim=0)
+            min_dists = torch.minimum(min_dists, sq_distances(X[idx]).squeeze(1))
+        
+        # Lloyd iterations
+        labels = sq_distances(centroids).argmin(dim=1)
+        for _ in range(n_iter):
+            sums = torch.zeros_like(centroids).index_add_(0, labels, X)
+            counts = torch.bincount(labels, minlength=k).to(X.dtype)
+            # Keep the previous centroid for clusters that lost all members
+            centroids = torch.where(
+                counts[:, None] > 0, sums / counts.clamp_min(1)[:, None], centroids
+            )
+            new_labels = sq_distances(centroids).argmin(dim=1)
+            if torch.equal(new_labels, labels):
+                break
+            labels = new_labels
+        
+        return labels, centroids
 
     def _select_important_sentences(self, 
                                   sentences: List[str], 
@@ -82,27 +317,24 @@ class BertSummarizer:
         if len(sentences) <= num_sentences:
             return sentences
             
-        # Convert embeddings to numpy for clustering
-        embeddings_np = embeddings.cpu().numpy()
+        # Perform K-means clustering on-device
+        labels, centers = self._kmeans_torch(embeddings, num_sentences)
         
-        # Perform K-means clustering
-        kmeans = KMeans(n_clusters=num_sentences, random_state=42)
-        clusters = kmeans.fit_predict(embeddings_np)
+        # Cosine similarity of every centroid to every sentence as one matmul
+        normed_embeddings = normalize(embeddings, dim=1)
+        similarities = normalize(centers, dim=1) @ normed_embeddings.T  # (k, N)
         
-        # Select sentences closest to cluster centers
-        important_sentences = []
-        for i in range(num_sentences):
-            cluster_sentences = [s for j, s in enumerate(sentences) if clusters[j] == i]
-            cluster_embeddings = embeddings[clusters == i]
-            
-            if len(cluster_sentences) > 0:
-                # Find sentence closest to cluster center
-                center_distances = cosine_similarity(
-                    kmeans.cluster_centers_[i].reshape(1, -1),
-                    cluster_embeddings
-                )
-                best_idx = center_distances.argmax()
-                important_sentences.append(cluster_sentences[best_idx])
+        # Restrict each centroid to the sentences assigned to its cluster
+        mask = labels[None, :] == torch.arange(num_sentences, device=embeddings.device)[:, None]
+        similarities.masked_fill_(~mask, float('-inf'))
+        best_indices = similarities.argmax(dim=1)
+        
+        # Select sentences closest to cluster centers, skipping empty clusters
+        non_empty = mask.any(dim=1)
+        important_sentences = [
+            sentences[idx]
+            for idx, keep in zip(best_indices.tolist(), non_empty.tolist()) if keep
+        ]
         
         return important_sentences
 
@@ -117,28 +349,26 @@ class BertSummarizer:
         Returns:
             List[str]: List of text chunks
         """
-        sentences = text.split('. ')
         chunks = []
         current_chunk = []
         current_length = 0
         
-        for sentence in sentences:
-            sentence_length = len(sentence)
+        for match in _SENTENCE_PATTERN.finditer(text):
+            sentence = match.group()
+            if not sentence.strip():
+                continue
             
-            if current_length + sentence_length > max_chunk_size:
-                if current_chunk:
-                    chunks.append('. '.join(current_chunk) + '.')
-                    current_chunk = [sentence]
-                    current_length = sentence_length
-                else:
-                    # Handle case where single sentence exceeds max_chunk_size
-                    chunks.append(sentence + '.')
-            else:
-                current_chunk.append(sentence)
-                current_length += sentence_length
+            # Flush before overflowing; a single oversized sentence becomes its own chunk
+            if current_chunk and current_length + len(sentence) > max_chunk_size:
+                chunks.append(''.join(current_chunk).strip())
+                current_chunk = []
+                current_length = 0
+            
+            current_chunk.append(sentence)
+            current_length += len(sentence)
         
         if current_chunk:
-            chunks.append('. '.join(current_chunk) + '.')
+            chunks.append(''.join(current_chunk).strip())
             
         return chunks
 
@@ -157,10 +387,10 @@ class BertSummarizer:
             # Split text into chunks
             chunks = self._chunk_text(text)
             
-            all_summaries = []
+            extractive_summaries = []
             for chunk in chunks:
                 # Split into sentences
-                sentences = chunk.split('. ')
+                sentences = [s.strip() for s in _SENTENCE_PATTERN.findall(chunk) if s.strip()]
                 
                 # Generate embeddings
                 embeddings = self._get_sentence_embeddings(sentences)
@@ -171,16 +401,31 @@ class BertSummarizer:
                     sentences, embeddings, num_sentences
                 )
                 
-                # Join selected sentences and generate abstractive summary
-                extractive_summary = ' '.join(important_sentences)
-                abstractive_summary = self.summarizer(
-                    extractive_summary,
-                    max_length=self.max_length,
-                    min_length=self.min_length,
-                    do_sample=False
-                )[0]['summary_text']
-                
-                all_summaries.append(abstractive_summary)
+                # Join selected sentences for the abstractive stage
+                extractive_summaries.append(' '.join(important_sentences))
+            
+            # Generate abstractive summaries for all chunks in one batch; text
+            # with no sentences (whitespace or punctuation only) has nothing to summarize
+            all_summaries = []
+            if extractive_summaries:
+                inputs = self.abs_tokenizer(extractive_summaries,
+                                            return_tensors='pt',
+                                            padding=True,
+                                            truncation=True,
+                                            max_length=1024).to(self.device)
+                with torch.inference_mode():
+                    summary_ids = self.abs_model.generate(
+                        **inputs,
+                        max_length=self.max_length,
+                        min_length=self.min_length,
+                        num_beams=1,
+                        do_sample=False,
+                        use_cache=True,
+                        early_stopping=True
+                    )
+                all_summaries = self.abs_tokenizer.batch_decode(
+                    summary_ids, skip_special_tokens=True
+                )
             
             # Combine summaries
             final_summary = ' '.join(all_summaries)
@@ -190,7 +435,7 @@ class BertSummarizer:
                 'metadata': {
                     'original_length': len(text),
                     'summary_length': len(final_summary),
-                    'compression_ratio': len(final_summary) / len(text),
+                    'compression_ratio': len(final_summary) / len(text) if text else 0.0,
                     'num_chunks': len(chunks)
                 }
             }
@@ -1,12 +1,16 @@
 from collections import Counter
 import re
 from typing import List, Set, Dict
-import nltk
-from nltk.tokenize import word_tokenize
-nltk.download('punkt')
+from tokenizers import Tokenizer
+from tokenizers.models import WordLevel
+from tokenizers.pre_tokenizers import Whitespace
+
+# Rust-backed pre-tokenizer splitting on the \w+|[^\w\s]+ pattern
+_PRE_TOKENIZER = Whitespace()
 
 class TextTokenizer:
-    def __init__(self, min_freq: int = 2, max_vocab: int = 10000, stop_words: Set[str] = None):
+    def __init__(self, min_freq: int = 2, max_vocab: int = 10000, stop_words: Set[str] = None,
+                 use_nltk: bool = False):
         """
         Initialize the tokenizer with vocabulary settings.
         
@@ -14,6 +18,7 @@ class TextTokenizer:
             min_freq (int): Minimum frequency for a token to be included in vocabulary
             max_vocab (int): Maximum vocabulary size
             stop_words (Set[str]): Set of words to exclude from tokenization
+            use_nltk (bool): Split words with nltk's word_tokenize instead of the fast pre-tokenizer
         """
         self.min_freq = min_freq
         self.max_vocab = max_vocab
@@ -21,6 +26,26 @@ class TextTokenizer:
         self.vocab = {}  # word -> index
         self.rev_vocab = {}  # index -> word
         self.word_freqs = Counter()
+        self.use_nltk = use_nltk
+        self._encoder = None  # Rust word-level encoder, built with the vocabulary
+        if use_nltk:
+            import nltk
+            nltk.download('punkt')
+        
+    def _split_words(self, text: str) -> List[str]:
+        """
+        Split text into word tokens.
+        
+        Args:
+            text (str): Cleaned text string
+            
+        Returns:
+            List[str]: List of word tokens
+        """
+        if self.use_nltk:
+            from nltk.tokenize import word_tokenize
+            return word_tokenize(text)
+        return [token for token, _ in _PRE_TOKENIZER.pre_tokenize_str(text)]
         
     def build_vocab(self, texts: List[str]) -> None:
         """
@@ -31,7 +56,7 @@ class TextTokenizer:
         """
         # Count word frequencies
         for text in texts:
-            tokens = word_tokenize(text)
+            tokens = self._split_words(text)
             self.word_freqs.update(tokens)
         
         # Filter by frequency and stop words
@@ -48,6 +73,11 @@ class TextTokenizer:
         self.vocab['<UNK>'] = 0  # Unknown token
         self.rev_vocab = {idx: word for word, idx in self.vocab.items()}
         
+        # Mirror the vocabulary in a Rust encoder so lookups skip the Python loop
+        if not self.use_nltk:
+            self._encoder = Tokenizer(WordLevel(vocab=self.vocab, unk_token='<UNK>'))
+            self._encoder.pre_tokenizer = _PRE_TOKENIZER
+        
     def tokenize(self, text: str) -> List[int]:
         """
         Convert text to sequence of token indices.
@@ -58,9 +88,25 @@ class TextTokenizer:
         Returns:
             List[int]: List of token indices
         """
-        tokens = word_tokenize(text)
+        if self._encoder is not None:
+            return self._encoder.encode(text).ids
+        tokens = self._split_words(text)
         return [self.vocab.get(token, 0) for token in tokens]  # 0 is <UNK>
     
+    def tokenize_batch(self, texts: List[str]) -> List[List[int]]:
+        """
+        Convert several texts to sequences of token indices in one call.
+        
+        Args:
+            texts (List[str]): List of cleaned text strings
+            
+        Returns:
+            List[List[int]]: List of token index lists, one per text
+        """
+        if self._encoder is not None:
+            return [encoding.ids for encoding in self._encoder.encode_batch(texts)]
+        return [self.tokenize(text) for text in texts]
+    
     def decode(self, token_ids: List[int]) -> str:
         """
         Convert token indices back to text.
@@ -1,22 +1,40 @@
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
 from typing import List, Tuple, Dict
 import pickle
 
 class TextVectorizer:
-    def __init__(self, max_features: int = 5000, ngram_range: Tuple[int, int] = (1, 1)):
+    def __init__(self, max_features: int = 5000, ngram_range: Tuple[int, int] = (1, 1),
+                 store_vocab: bool = True, n_features: int = 2**20):
         """
         Initialize the vectorizer.
         
         Args:
-            max_features (int): Maximum number of features for TF-IDF
+            max_features (int): Maximum number of features for TF-IDF (vocabulary mode only)
             ngram_range (Tuple[int, int]): Range of n-gram sizes
+            store_vocab (bool): Keep an in-memory vocabulary; if False, hash terms instead
+                so fitting needs no vocabulary, at the cost of get_top_terms
+            n_features (int): Number of hash buckets when store_vocab is False
         """
-        self.tfidf = TfidfVectorizer(
-            max_features=max_features,
-            ngram_range=ngram_range,
-            lowercase=False  # Text should already be cleaned
-        )
+        self.store_vocab = store_vocab
+        if store_vocab:
+            self.hasher = None
+            self.tfidf = TfidfVectorizer(
+                max_features=max_features,
+                ngram_range=ngram_range,
+                lowercase=False  # Text should already be cleaned
+            )
+        else:
+            # Raw hashed counts; TfidfTransformer applies weighting and normalization
+            self.hasher = HashingVectorizer(
+                n_features=n_features,
+                ngram_range=ngram_range,
+                alternate_sign=False,
+                norm=None,
+                lowercase=False  # Text should already be cleaned
+            )
+            self.tfidf = TfidfTransformer()
         self.feature_names = None
         self.vocab_size = 0
         
@@ -27,21 +45,40 @@ class TextVectorizer:
         Args:
             texts (List[str]): List of cleaned text strings
         """
+        if not self.store_vocab:
+            self.tfidf.fit(self.hasher.transform(texts))
+            self.vocab_size = self.hasher.n_features
+            return
+        
         self.tfidf.fit(texts)
         self.feature_names = self.tfidf.get_feature_names_out()
         self.vocab_size = len(self.feature_names)
         
-    def transform(self, texts: List[str]) -> np.ndarray:
+    def transform(self, texts: List[str]) -> sp.csr_matrix:
         """
         Transform texts to TF-IDF vectors.
         
+        Args:
+            texts (List[str]): List of cleaned text strings
+            
+        Returns:
+            sp.csr_matrix: Sparse TF-IDF matrix
+        """
+        if not self.store_vocab:
+            return self.tfidf.transform(self.hasher.transform(texts))
+        return self.tfidf.transform(texts)
+    
+    def transform_dense(self, texts: List[str]) -> np.ndarray:
+        """
+        Transform texts to dense TF-IDF vectors.
+        
         Args:
             texts (List[str]): List of cleaned text strings
             
         Returns:
             np.ndarray: TF-IDF matrix
         """
-        return self.tfidf.transform(texts).toarray()
+        return self.transform(texts).toarray()
     
     def get_top_terms(self, text: str, n: int = 5) -> List[Tuple[str, float]]:
         """
@@ -54,11 +91,21 @@ class TextVectorizer:
         Returns:
             List[Tuple[str, float]]: List of (term, score) pairs
         """
-        vector = self.transform([text])[0]
-        top_indices = vector.argsort()[-n:][::-1]
+        if not self.store_vocab:
+            raise ValueError("get_top_terms requires a vectorizer created with store_vocab=True")
+        
+        # Only the non-zero entries of the sparse 1 x V row can be top terms;
+        # a single-row CSR matrix's data/indices are that row, so no copy is needed
+        row = self.tfidf.transform([text])
+        if row.nnz == 0:
+            return []
+        
+        k = min(n, row.nnz)
+        top = np.argpartition(-row.data, k - 1)[:k]
+        top = top[np.argsort(-row.data[top])]
         return [
-            (self.feature_names[i], vector[i])
-            for i in top_indices if vector[i] > 0
+            (self.feature_names[row.indices[i]], float(row.data[i]))
+            for i in top
         ]
     
     def save(self, filepath: str) -> None:
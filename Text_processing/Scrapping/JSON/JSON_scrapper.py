@@ -1,4 +1,5 @@
-import json
+import io
+import ijson
 import logging
 
 def scrape_json(file_path, text_fields=None):
@@ -13,27 +14,40 @@ def scrape_json(file_path, text_fields=None):
         dict: Contains 'text' (combined text content) and 'metadata' (structure info)
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            
-        def extract_text(obj, fields=None):
-            text = []
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if fields is None or key in fields:
-                        if isinstance(value, str):
-                            text.append(value)
-                        elif isinstance(value, (dict, list)):
-                            text.extend(extract_text(value, fields))
-            elif isinstance(obj, list):
-                for item in obj:
-                    text.extend(extract_text(item, fields))
-            return text
+        fields = frozenset(text_fields) if text_fields is not None else None
         
-        extracted_text = extract_text(data, text_fields)
+        # Stream parse events instead of loading the whole document. Each open
+        # container tracks whether it is reachable through selected fields and,
+        # for objects, the key currently being read
+        extracted_text = io.StringIO()
+        num_values = 0
+        containers = []  # [is_object, reachable, current_key]
+        with open(file_path, 'rb') as file:
+            for _, event, value in ijson.parse(file):
+                if event == 'map_key':
+                    containers[-1][2] = value
+                elif event in ('start_map', 'start_array'):
+                    if containers:
+                        is_object, reachable, key = containers[-1]
+                        reachable = reachable and (
+                            not is_object or fields is None or key in fields
+                        )
+                    else:
+                        reachable = True
+                    containers.append([event == 'start_map', reachable, None])
+                elif event in ('end_map', 'end_array'):
+                    containers.pop()
+                elif event == 'string' and containers:
+                    # Only string values of selected object fields are extracted
+                    is_object, reachable, key = containers[-1]
+                    if is_object and reachable and (fields is None or key in fields):
+                        if num_values:
+                            extracted_text.write(' ')
+                        extracted_text.write(value)
+                        num_values += 1
         
         return {
-            'text': ' '.join(extracted_text),
+            'text': extracted_text.getvalue(),
             'metadata': {
                 'file_path': file_path,
                 'text_fields': text_fields
@@ -1,7 +1,55 @@
 import PyPDF2
+import pypdfium2 as pdfium
 import io
 import logging
 
+def _extract_pdfium(file_path):
+    """
+    Extracts text with the pdfium C++ backend.
+    
+    Args:
+        file_path (str): Path to the PDF file
+        
+    Returns:
+        tuple: Space-separated text of all pages and the number of pages
+    """
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        text = io.StringIO()
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            if i:
+                text.write(' ')
+            text.write(textpage.get_text_range())
+            
+            # Release native page resources as soon as the text is read
+            textpage.close()
+            page.close()
+        return text.getvalue(), len(pdf)
+    finally:
+        pdf.close()
+
+def _extract_pypdf2(file_path):
+    """
+    Extracts text with PyPDF2.
+    
+    Args:
+        file_path (str): Path to the PDF file
+        
+    Returns:
+        tuple: Space-separated text of all pages and the number of pages
+    """
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        
+        text = io.StringIO()
+        for i, page in enumerate(reader.pages):
+            if i:
+                text.write(' ')
+            text.write(page.extract_text() or '')
+        return text.getvalue(), len(reader.pages)
+
 def scrape_pdf(file_path):
     """
     Extracts text from a PDF file.
@@ -13,20 +61,20 @@ def scrape_pdf(file_path):
         dict: Contains 'text' (full content) and 'metadata' (number of pages, etc.)
     """
     try:
-        with open(file_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            
-            text = []
-            for page in reader.pages:
-                text.append(page.extract_text())
-            
-            return {
-                'text': ' '.join(text),
-                'metadata': {
-                    'num_pages': len(reader.pages),
-                    'file_path': file_path
-                }
+        try:
+            text, num_pages = _extract_pdfium(file_path)
+        except pdfium.PdfiumError as e:
+            # Fall back to the pure-Python reader for files pdfium cannot parse
+            logging.warning(f"pdfium failed on {file_path}, falling back to PyPDF2: {str(e)}")
+            text, num_pages = _extract_pypdf2(file_path)
+        
+        return {
+            'text': text,
+            'metadata': {
+                'num_pages': num_pages,
+                'file_path': file_path
             }
+        }
     except Exception as e:
         logging.error(f"Error processing PDF {file_path}: {str(e)}")
         return None
\ No newline at end of file
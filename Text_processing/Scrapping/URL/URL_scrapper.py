@@ -1,7 +1,58 @@
+import asyncio
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+# Skip everything in <head> except the title and meta tags at parse time; the
+# body is kept whole and parse_html strips its boilerplate containers
+CONTENT_STRAINER = SoupStrainer(['title', 'meta', 'body'])
+
+# Shared session so sequential requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+def parse_html(url, content):
+    """
+    Extracts text content and metadata from a fetched HTML page.
+    
+    Args:
+        url (str): The URL the page was fetched from
+        content (bytes): Raw response body
+        
+    Returns:
+        dict: Contains 'text' (main content), 'title' (page title), and 'metadata' (description, keywords)
+    """
+    # Pass raw bytes so lxml handles decoding itself
+    soup = BeautifulSoup(content, 'lxml', parse_only=CONTENT_STRAINER)
+    
+    # Remove script and style elements
+    for script in soup(['script', 'style', 'header', 'footer', 'nav']):
+        script.decompose()
+    
+    # Extract text
+    text = ' '.join(soup.stripped_strings)
+    
+    # Extract metadata as plain str: a bs4 NavigableString references the whole
+    # parse tree and cannot be pickled back from a process pool
+    title = str(soup.title.string) if soup.title and soup.title.string else ''
+    meta_desc = soup.find('meta', {'name': 'description'})
+    description = str(meta_desc['content']) if meta_desc and meta_desc.get('content') else ''
+    
+    return {
+        'text': text,
+        'title': title,
+        'metadata': {
+            'description': description,
+            'url': url
+        }
+    }
+
 def scrape_url(url):
     """
     Scrapes text content from a given URL.
@@ -13,32 +64,67 @@ def scrape_url(url):
         dict: Contains 'text' (main content), 'title' (page title), and 'metadata' (description, keywords)
     """
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return parse_html(url, response.content)
+    except Exception as e:
+        logging.error(f"Error scraping URL {url}: {str(e)}")
+        return None
+
+def create_async_client(max_concurrency=32):
+    """
+    Creates the shared HTTP/2 client used for concurrent URL scraping.
+    
+    Args:
+        max_concurrency (int): Maximum number of pooled connections
+        
+    Returns:
+        httpx.AsyncClient: Client to be used as an async context manager
+    """
+    limits = httpx.Limits(max_connections=max_concurrency,
+                          max_keepalive_connections=max_concurrency)
+    return httpx.AsyncClient(http2=True, headers=HEADERS, timeout=10,
+                             limits=limits, follow_redirects=True)
+
+async def scrape_url_async(client, semaphore, url, executor=None):
+    """
+    Scrapes text content from a URL on an async client, holding the semaphore while in flight.
+    
+    Args:
+        client (httpx.AsyncClient): Client created by create_async_client
+        semaphore (asyncio.Semaphore): Caps the number of URLs in flight
+        url (str): The URL to scrape
+        executor (concurrent.futures.Executor): If given, HTML is parsed there instead of on the event loop
         
-        # Remove script and style elements
-        for script in soup(['script', 'style', 'header', 'footer', 'nav']):
-            script.decompose()
+    Returns:
+        dict: Same result as scrape_url, or None on failure
+    """
+    async with semaphore:
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
             
-        # Extract text
-        text = ' '.join(soup.stripped_strings)
-        
-        # Extract metadata
-        title = soup.title.string if soup.title else ''
-        meta_desc = soup.find('meta', {'name': 'description'})
-        description = meta_desc['content'] if meta_desc else ''
+            if executor is None:
+                return parse_html(url, response.content)
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, parse_html, url, response.content
+            )
+        except Exception as e:
+            logging.error(f"Error scraping URL {url}: {str(e)}")
+            return None
+
+async def scrape_url_many(urls, max_concurrency=32):
+    """
+    Scrapes text content from several URLs concurrently over a shared HTTP/2 client.
+    
+    Args:
+        urls (list): The URLs to scrape
+        max_concurrency (int): Maximum number of URLs in flight at once
         
-        return {
-            'text': text,
-            'title': title,
-            'metadata': {
-                'description': description,
-                'url': url
-            }
-        }
-    except Exception as e:
-        logging.error(f"Error scraping URL {url}: {str(e)}")
-        return None
\ No newline at end of file
+    Returns:
+        list: One result per URL, in input order, as returned by scrape_url (None on failure)
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    async with create_async_client(max_concurrency) as client:
+        return await asyncio.gather(*[scrape_url_async(client, semaphore, url) for url in urls])
\ No newline at end of file